@@ -0,0 +1,101 @@
+""" Optional accelerated batch parsing of PubMed publication dates.
+
+PubMed publication dates are rigid Year/Month/Day integer triples. When
+Numba and NumPy are available, the conversion to proleptic ordinals is
+JIT-compiled and runs over a whole batch at once; otherwise a scalar
+pure-Python fallback is used.
+"""
+
+import datetime
+
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _parse_date_scalar(
+    year: Optional[str], month: Optional[str], day: Optional[str]
+) -> Optional[datetime.date]:
+    """Parses a single (year, month, day) string triple into a date.
+
+    Args:
+        year (str or None): The year component.
+        month (str or None): The month component.
+        day (str or None): The day component.
+
+    Returns:
+        Optional[datetime.date]: The parsed date, or `None` if any component
+        is missing or invalid.
+    """
+    if not (year and month and day):
+        return None
+    try:
+        return datetime.date(year=int(year), month=int(month), day=int(day))
+    except ValueError:
+        return None
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True)
+    def _ymd_to_ordinals(years, months, days):  # pragma: no cover - needs numba
+        """Converts year/month/day arrays to proleptic ordinals (0 = invalid)."""
+        days_before_month = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+        days_in_month = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+        out = np.zeros(years.shape[0], dtype=np.int64)
+        for i in range(years.shape[0]):
+            year, month, day = years[i], months[i], days[i]
+            if year < 1 or month < 1 or month > 12 or day < 1:
+                continue
+            leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+            if day > days_in_month[month] + (1 if month == 2 and leap else 0):
+                continue
+            prior = year - 1
+            ordinal = prior * 365 + prior // 4 - prior // 100 + prior // 400
+            ordinal += days_before_month[month] + (1 if month > 2 and leap else 0)
+            out[i] = ordinal + day
+        return out
+
+
+def parse_dates(
+    triples: Sequence[Tuple[Optional[str], Optional[str], Optional[str]]]
+) -> List[Optional[datetime.date]]:
+    """Parses a batch of (year, month, day) string triples into dates.
+
+    Args:
+        triples (Sequence[Tuple]): The (year, month, day) string triples to
+            parse, one per article.
+
+    Returns:
+        List[Optional[datetime.date]]: The parsed dates, with `None` for
+        triples that are missing or invalid.
+    """
+    # Fall back to the scalar path when the JIT kernel is unavailable or
+    # the batch is too small for the conversion to pay off
+    if not HAS_NUMBA or len(triples) < 2:
+        return [_parse_date_scalar(*triple) for triple in triples]
+
+    # Convert the components to integer arrays (0 marks an invalid triple)
+    years = np.zeros(len(triples), dtype=np.int64)
+    months = np.zeros(len(triples), dtype=np.int64)
+    days = np.zeros(len(triples), dtype=np.int64)
+    for index, (year, month, day) in enumerate(triples):
+        try:
+            years[index] = int(year)
+            months[index] = int(month)
+            days[index] = int(day)
+        except (TypeError, ValueError):
+            years[index] = 0
+
+    # Run the compiled kernel and materialize dates at the boundary
+    ordinals = _ymd_to_ordinals(years, months, days)
+    return [
+        datetime.date.fromordinal(ordinal) if ordinal else None
+        for ordinal in ordinals
+    ]
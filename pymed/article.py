@@ -1,12 +1,94 @@
 """ This module contains the Article and Book classes, which is used to represent a PubMed articles. """
 
+import io
 import json
 import datetime
+import operator
+
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple, Union
+
+from ._fastdate import parse_dates
+from .utils import Element, compile_path, etree, get_content
+
+# orjson (Rust) encodes severalfold faster than the standard library and
+# handles dates natively; fall back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled XPath expressions, hoisted to module level so the paths are only
+# parsed once instead of once per article
+_XP_TITLE = compile_path(".//ArticleTitle")
+_XP_KEYWORD = compile_path(".//Keyword")
+_XP_ABSTRACT = compile_path(".//AbstractText")
+_XP_DOI = compile_path(".//ArticleId[@IdType='doi']")
+_XP_PUB_DATE = compile_path(".//PubMedPubDate[@PubStatus='pubmed']")
+_XP_AUTHOR = compile_path(".//Author")
+_XP_AFFILIATION = compile_path(".//AffiliationInfo/Affiliation")
+_XP_ISBN = compile_path(".//Isbn")
+_XP_LANGUAGE = compile_path(".//Language")
+_XP_PUBLICATION_TYPE = compile_path(".//PublicationType")
+_XP_SECTION = compile_path(".//Section")
+
+
+class Author:
+    """Lightweight record for a single author of a PubMed article.
+
+    A `__slots__` object is a fraction of the size of the per-author dict it
+    replaces, which adds up for result sets with thousands of authors.
+    """
+
+    __slots__ = ("lastname", "firstname", "initials", "affiliation")
+
+    def __init__(
+        self,
+        lastname: str = "",
+        firstname: str = "",
+        initials: str = "",
+        affiliation: str = "",
+    ) -> None:
+        self.lastname = lastname
+        self.firstname = firstname
+        self.initials = initials
+        self.affiliation = affiliation
+
+    def __getitem__(self, key: str) -> str:
+        # Keep the dict-style access (author["lastname"]) of the old format
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, str]:
+        """Helper method to convert the author to a Python dict.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the author information.
+        """
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+def _json_default(value: object) -> Union[str, Dict[str, str]]:
+    """Fallback serializer for field types the JSON encoder cannot handle.
+
+    Only called by the encoder for the (few) values it cannot serialize
+    directly, so the isinstance checks stay off the hot path.
+
+    Args:
+        value (object): The value that could not be serialized directly.
+
+    Returns:
+        Union[str, Dict[str, str]]: A JSON-serializable form of the value.
+    """
+    if isinstance(value, Author):
+        return value.to_dict()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, Element):
+        return etree.tostring(value, encoding="unicode")
+    return str(value)
 
-from xml.etree.ElementTree import Element
-from typing import Dict, List, Optional
 
-from .utils import get_content
+# Shared encoder for the common compact (non-indented, unsorted) output path
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), default=_json_default)
 
 
 class PubMedBaseArticle:
@@ -14,6 +96,17 @@ class PubMedBaseArticle:
 
     __slots__ = ("pubmed_id", "title", "abstract", "publication_date", "authors", "doi")
 
+    # Combined base + subclass slots, and a C-level getter over all of them
+    # (both are recomputed per subclass in __init_subclass__)
+    _ALL_SLOTS = __slots__
+    _GET_ALL = operator.attrgetter(*__slots__)
+
+    def __init_subclass__(cls, **kwargs: dict) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._ALL_SLOTS = PubMedBaseArticle.__slots__ + cls.__slots__
+        cls._GET_ALL = operator.attrgetter(*cls._ALL_SLOTS)
+        cls._SLOT_DESCRIPTORS = tuple(getattr(cls, slot) for slot in cls._ALL_SLOTS)
+
     def __init__(self, xml_element: Optional[Element] = None, **kwargs: dict) -> None:
         # If an XML element is provided, use it for initialization
         if xml_element is not None:
@@ -21,9 +114,26 @@ class PubMedBaseArticle:
 
         # If no XML element was provided, try to parse the input parameters
         else:
-            for field in self.__slots__:
+            for field in self._ALL_SLOTS:
                 self.__setattr__(field, kwargs.get(field, None))
 
+    @classmethod
+    def from_xml(cls, xml_element: Element) -> "PubMedBaseArticle":
+        """Specialized constructor for the XML parsing path.
+
+        Bypasses __init__ entirely, so the dominant bulk-parsing path skips
+        the kwargs fallback handling that only keyword construction needs.
+
+        Args:
+            xml_element (Element): The XML element to parse.
+
+        Returns:
+            PubMedBaseArticle: The constructed article object.
+        """
+        article = cls.__new__(cls)
+        article.initialize_from_xml(xml_element=xml_element)
+        return article
+
     def initialize_from_xml(self, xml_element: Element) -> None:
         """
         Initializes the article object by parsing an XML element.
@@ -36,6 +146,22 @@ class PubMedBaseArticle:
         """
         raise NotImplementedError
 
+    def _bulk_set(self, values: Iterable) -> None:
+        """Assigns every slot at once through its descriptor.
+
+        Descriptor __set__ is a single C-level call per field, skipping the
+        Python attribute-setting protocol on the bulk parsing path. `values`
+        must follow the `_ALL_SLOTS` order.
+
+        Args:
+            values (Iterable): One value per slot, in slot order.
+
+        Returns:
+            None
+        """
+        for descriptor, value in zip(self._SLOT_DESCRIPTORS, values):
+            descriptor.__set__(self, value)
+
     def to_dict(self) -> dict:
         """Helper method to convert the parsed information to a Python dict.
 
@@ -43,32 +169,85 @@ class PubMedBaseArticle:
             dict: A dictionary containing the parsed information.
         """
 
-        return {key: self.__getattribute__(key) for key in self.__slots__}
+        return dict(zip(self._ALL_SLOTS, self._GET_ALL(self)))
+
+    def dump_json(
+        self, fp: TextIO, *, indent: Optional[int] = None, sort_keys: bool = False
+    ) -> None:
+        """Serializes the object as JSON directly into a file-like object.
+
+        Streaming into a sink avoids materializing the full JSON string in
+        memory; unserializable field types (dates, XML elements) are coerced
+        on the fly instead of through an intermediate dict.
 
-    def to_json(self) -> str:
+        Args:
+            fp (TextIO): The file-like object to write the JSON to.
+            indent (int or None, optional): Indentation level for
+                pretty-printing, compact output when None. Defaults to None.
+            sort_keys (bool, optional): Whether to sort the keys alphabetically.
+                Defaults to False (slot declaration order).
+
+        Returns:
+            None
+        """
+        if indent is None and not sort_keys:
+            if orjson is not None:
+                fp.write(orjson.dumps(self.to_dict(), default=_json_default).decode())
+            else:
+                for chunk in _JSON_ENCODER.iterencode(self.to_dict()):
+                    fp.write(chunk)
+        else:
+            json.dump(
+                self.to_dict(),
+                fp,
+                default=_json_default,
+                indent=indent,
+                sort_keys=sort_keys,
+            )
+
+    def to_jsonline(self) -> str:
+        """Converts the object to a single-line JSON record (JSON Lines).
+
+        Compact separators and the absence of indentation keep the record on
+        one line, so a stream of articles can be parsed line by line with
+        bounded memory. The caller is responsible for adding the newline.
+
+        Returns:
+            str: The compact single-line JSON representation of the object.
+        """
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), default=_json_default).decode()
+        return _JSON_ENCODER.encode(self.to_dict())
+
+    def to_json(
+        self, *, indent: Optional[int] = None, sort_keys: bool = False
+    ) -> str:
         """Converts the object to a JSON string representation.
 
+        Args:
+            indent (int or None, optional): Indentation level for
+                pretty-printing, compact output when None. Defaults to None.
+            sort_keys (bool, optional): Whether to sort the keys alphabetically.
+                Defaults to False (slot declaration order).
+
         Returns:
             str: The JSON string representation of the object.
         """
-        return json.dumps(
-            {
-                key: (
-                    value
-                    if not isinstance(value, (datetime.date, Element))
-                    else str(value)
-                )
-                for key, value in self.to_dict().items()
-            },
-            sort_keys=True,
-            indent=4,
-        )
+        buffer = io.StringIO()
+        self.dump_json(buffer, indent=indent, sort_keys=sort_keys)
+        return buffer.getvalue()
+
+
+# The base class body cannot reference its own slot descriptors, resolve them here
+PubMedBaseArticle._SLOT_DESCRIPTORS = tuple(
+    getattr(PubMedBaseArticle, slot) for slot in PubMedBaseArticle.__slots__
+)
 
 
 class Paper(PubMedBaseArticle):
     """Data class that contains a PubMed article."""
 
-    __slots__ = (
+    __slots__ = (  # "xml" is only populated when keep_xml is requested
         "keywords",
         "journal",
         "methods",
@@ -78,6 +257,39 @@ class Paper(PubMedBaseArticle):
         "xml",
     )
 
+    def __init__(
+        self,
+        xml_element: Optional[Element] = None,
+        keep_xml: bool = False,
+        **kwargs: dict,
+    ) -> None:
+        # If an XML element is provided, use it for initialization
+        if xml_element is not None:
+            self.initialize_from_xml(xml_element=xml_element, keep_xml=keep_xml)
+
+        # If no XML element was provided, try to parse the input parameters
+        else:
+            super().__init__(**kwargs)
+
+    @classmethod
+    def from_xml(cls, xml_element: Element, keep_xml: bool = False) -> "Paper":
+        """Specialized constructor for the XML parsing path.
+
+        Bypasses __init__ entirely, so the dominant bulk-parsing path skips
+        the kwargs fallback handling that only keyword construction needs.
+
+        Args:
+            xml_element (Element): The XML element to parse.
+            keep_xml (bool, optional): Whether to keep a reference to the raw
+                XML element on the article. Defaults to False.
+
+        Returns:
+            Paper: The constructed article object.
+        """
+        article = cls.__new__(cls)
+        article.initialize_from_xml(xml_element=xml_element, keep_xml=keep_xml)
+        return article
+
     def extract_pubmed_id(self, xml_element: Element) -> str:
         """Extracts the PubMed ID from the XML element.
 
@@ -87,8 +299,7 @@ class Paper(PubMedBaseArticle):
         Returns:
             str: PubMed ID of the article.
         """
-        path = "MedlineCitation/PMID"
-        return get_content(element=xml_element, path=path)
+        return xml_element.findtext("MedlineCitation/PMID", "")
 
     def extract_title(self, xml_element: Element) -> str:
         """Extracts the PubMed title from the XML element.
@@ -99,22 +310,20 @@ class Paper(PubMedBaseArticle):
         Returns:
             str: Title of the article.
         """
-        path = ".//ArticleTitle"
-        return get_content(element=xml_element, path=path)
+        return get_content(element=xml_element, path=_XP_TITLE)
 
-    def extract_keywords(self, xml_element: Element) -> List[str | None]:
+    def extract_keywords(self, xml_element: Element) -> Tuple[str, ...]:
         """Extracts the Keywords from the XML element of a PubMed Article.
 
         Args:
             xml_element (Element): XML element to extract the keywords from.
 
         Returns:
-            str: Keywords of the article.
+            Tuple[str, ...]: Keywords of the article, empty keywords excluded.
         """
-        path = ".//Keyword"
-        return [
-            keyword.text for keyword in xml_element.findall(path) if keyword is not None
-        ]
+        return tuple(
+            keyword.text for keyword in _XP_KEYWORD(xml_element) if keyword.text
+        )
 
     def extract_journal(self, xml_element: Element) -> str:
         """Extracts the journal title from the XML element of a PubMed Article.
@@ -125,8 +334,7 @@ class Paper(PubMedBaseArticle):
         Returns:
             str: Journal of the article.
         """
-        path = ".//Journal/Title"
-        return get_content(element=xml_element, path=path)
+        return xml_element.findtext(".//Journal/Title", "")
 
     def extract_abstract(self, xml_element: Element) -> str:
         """Extracts the abstract from the XML element of a PubMed Article.
@@ -137,8 +345,27 @@ class Paper(PubMedBaseArticle):
         Returns:
             str: Abstract of the article.
         """
-        path = ".//AbstractText"
-        return get_content(element=xml_element, path=path)
+        return get_content(element=xml_element, path=_XP_ABSTRACT)
+
+    @staticmethod
+    def _extract_labeled_abstracts(xml_element: Element) -> Dict[str, str]:
+        """Collects the labeled AbstractText sections in a single scan.
+
+        One pass over the AbstractText nodes replaces the three separate
+        label-predicate XPath walks for conclusions, methods and results.
+
+        Args:
+            xml_element (Element): XML element to extract the sections from.
+
+        Returns:
+            Dict[str, str]: The joined text per label, empty when absent.
+        """
+        sections: Dict[str, List[str]] = {"CONCLUSION": [], "METHOD": [], "RESULTS": []}
+        for abstract_text in _XP_ABSTRACT(xml_element):
+            parts = sections.get(abstract_text.get("Label"))
+            if parts is not None and abstract_text.text is not None:
+                parts.append(abstract_text.text)
+        return {label: "\n".join(parts) for label, parts in sections.items()}
 
     def extract_conclusions(self, xml_element: Element) -> str:
         """Extracts the conclusions from the XML element of a PubMed Article.
@@ -149,8 +376,7 @@ class Paper(PubMedBaseArticle):
         Returns:
             str: Conclusions of the article.
         """
-        path = ".//AbstractText[@Label='CONCLUSION']"
-        return get_content(element=xml_element, path=path)
+        return self._extract_labeled_abstracts(xml_element)["CONCLUSION"]
 
     def extract_methods(self, xml_element: Element) -> str:
         """Extracts the methods from the XML element of a PubMed Article.
@@ -161,8 +387,7 @@ class Paper(PubMedBaseArticle):
         Returns:
             str: Methods of the article.
         """
-        path = ".//AbstractText[@Label='METHOD']"
-        return get_content(element=xml_element, path=path)
+        return self._extract_labeled_abstracts(xml_element)["METHOD"]
 
     def extract_results(self, xml_element: Element) -> str:
         """Extracts the results from the XML element of a PubMed Article.
@@ -173,8 +398,7 @@ class Paper(PubMedBaseArticle):
         Returns:
             str: Results of the article.
         """
-        path = ".//AbstractText[@Label='RESULTS']"
-        return get_content(element=xml_element, path=path)
+        return self._extract_labeled_abstracts(xml_element)["RESULTS"]
 
     def extract_copyrights(self, xml_element: Element) -> str:
         """Extracts the copyrights from the XML element of a PubMed Article.
@@ -185,8 +409,7 @@ class Paper(PubMedBaseArticle):
         Returns:
             str: Copyrights of the article.
         """
-        path = ".//CopyrightInformation"
-        return get_content(element=xml_element, path=path)
+        return xml_element.findtext(".//CopyrightInformation", "")
 
     def extract_doi(self, xml_element: Element) -> str:
         """Extracts the DOI from the XML element of a PubMed Article.
@@ -197,8 +420,69 @@ class Paper(PubMedBaseArticle):
         Returns:
             str: DOI of the article.
         """
-        path = ".//ArticleId[@IdType='doi']"
-        return get_content(element=xml_element, path=path)
+        return get_content(element=xml_element, path=_XP_DOI)
+
+    @staticmethod
+    def _parse_publication_date(
+        publication_date: Element,
+    ) -> Optional[datetime.date]:
+        """
+        Parses the Year/Month/Day children of a PubMedPubDate element.
+
+        Args:
+            publication_date (Element): The PubMedPubDate element to parse.
+
+        Returns:
+            Optional[datetime.date]: The publication date as a `datetime.date`
+            object, or `None` if the date cannot be parsed.
+        """
+        # findtext is a single direct child lookup, no XPath machinery needed
+        year = publication_date.findtext("Year")
+        month = publication_date.findtext("Month")
+        day = publication_date.findtext("Day")
+        if not (year and month and day):
+            return None
+
+        # Construct a datetime object from the info
+        try:
+            return datetime.date(year=int(year), month=int(month), day=int(day))
+        except ValueError:
+            return None
+
+    @classmethod
+    def extract_publication_dates_batch(
+        cls, elements: List[Element]
+    ) -> List[Optional[datetime.date]]:
+        """
+        Extracts the publication dates of a batch of article elements at once.
+
+        The Year/Month/Day strings are gathered first and converted in a
+        single batch by `pymed._fastdate`, which uses a Numba-compiled kernel
+        when available. For bulk jobs this is considerably faster than
+        constructing each date separately.
+
+        Args:
+            elements (List[Element]): The article XML elements to process.
+
+        Returns:
+            List[Optional[datetime.date]]: One publication date (or `None`)
+            per input element.
+        """
+        triples = []
+        for element in elements:
+            matches = _XP_PUB_DATE(element)
+            if matches:
+                publication_date = matches[0]
+                triples.append(
+                    (
+                        publication_date.findtext("Year"),
+                        publication_date.findtext("Month"),
+                        publication_date.findtext("Day"),
+                    )
+                )
+            else:
+                triples.append((None, None, None))
+        return parse_dates(triples)
 
     def extract_publication_date(self, xml_element: Element) -> datetime.date | None:
         """
@@ -211,23 +495,12 @@ class Paper(PubMedBaseArticle):
             datetime.date | None: The extracted publication date as a `datetime.date` object,
             or `None` if the publication date cannot be parsed.
         """
-        try:
-            # Get the publication elements
-            publication_date = xml_element.find(".//PubMedPubDate[@PubStatus='pubmed']")
-            publication_year = int(get_content(publication_date, ".//Year", ""))
-            publication_month = int(get_content(publication_date, ".//Month", ""))
-            publication_day = int(get_content(publication_date, ".//Day", ""))
-
-            # Construct a datetime object from the info
-            return datetime.date(
-                year=publication_year, month=publication_month, day=publication_day
-            )
-
-        except ValueError as e:
-            print(e)
+        matches = _XP_PUB_DATE(xml_element)
+        if not matches:
             return None
+        return self._parse_publication_date(matches[0])
 
-    def extract_authors(self, xml_element: Element) -> List[Dict[str, str]]:
+    def extract_authors(self, xml_element: Element) -> List[Author]:
         """
         Extracts author information from an XML element.
 
@@ -235,48 +508,138 @@ class Paper(PubMedBaseArticle):
             xml_element (Element): The XML element containing author information.
 
         Returns:
-            list: A list of dictionaries, where each dictionary represents an author and contains the following keys:
-                - "lastname": The last name of the author.
-                - "firstname": The first name of the author.
-                - "initials": The initials of the author.
-                - "affiliation": The affiliation of the author.
+            List[Author]: A list of `Author` records with the last name, first
+            name, initials and affiliation of each author.
         """
         return [
-            {
-                "lastname": get_content(author, ".//LastName", ""),
-                "firstname": get_content(author, ".//ForeName", ""),
-                "initials": get_content(author, ".//Initials", ""),
-                "affiliation": get_content(
-                    author, ".//AffiliationInfo/Affiliation", ""
-                ),
-            }
-            for author in xml_element.findall(".//Author")
+            Author(
+                lastname=author.findtext(".//LastName", ""),
+                firstname=author.findtext(".//ForeName", ""),
+                initials=author.findtext(".//Initials", ""),
+                affiliation=get_content(author, _XP_AFFILIATION, ""),
+            )
+            for author in _XP_AUTHOR(xml_element)
         ]
 
-    def initialize_from_xml(self, xml_element: Element) -> None:
+    @classmethod
+    def _parse_stream(cls, xml_element: Element) -> dict:
+        """
+        Parses all article fields in a single pass over the XML tree.
+
+        Walks the tree once (tracking the parent tag for context-sensitive
+        fields) and dispatches on the tag name, instead of re-traversing the
+        subtree once per field like the individual `extract_*` methods do.
+
+        Args:
+            xml_element (Element): The XML element to parse.
+
+        Returns:
+            dict: A mapping of field names to their parsed values.
+        """
+        # Collectors for the text fields (joined like `get_content` does)
+        parts: Dict[str, List[str]] = {
+            "pubmed_id": [],
+            "title": [],
+            "journal": [],
+            "abstract": [],
+            "conclusions": [],
+            "methods": [],
+            "results": [],
+            "copyrights": [],
+            "doi": [],
+        }
+        keywords: List[str] = []
+        authors: List[Author] = []
+        publication_date = None
+        publication_date_seen = False
+
+        # Depth-first walk over the tree, keeping track of the parent tag
+        stack = [(child, xml_element.tag) for child in reversed(list(xml_element))]
+        while stack:
+            node, parent_tag = stack.pop()
+            tag = node.tag
+
+            # Authors and publication dates are parsed from their own
+            # subtree, so there is no need to descend into them
+            if tag == "Author":
+                authors.append(
+                    Author(
+                        lastname=node.findtext(".//LastName", ""),
+                        firstname=node.findtext(".//ForeName", ""),
+                        initials=node.findtext(".//Initials", ""),
+                        affiliation=get_content(node, _XP_AFFILIATION, ""),
+                    )
+                )
+                continue
+            if tag == "PubMedPubDate":
+                if node.get("PubStatus") == "pubmed" and not publication_date_seen:
+                    publication_date_seen = True
+                    publication_date = cls._parse_publication_date(node)
+                continue
+
+            # Route the leaf text nodes into the right collector
+            if tag == "PMID":
+                if parent_tag == "MedlineCitation" and node.text is not None:
+                    parts["pubmed_id"].append(node.text)
+            elif tag == "ArticleTitle":
+                if node.text is not None:
+                    parts["title"].append(node.text)
+            elif tag == "Keyword":
+                if node.text:
+                    keywords.append(node.text)
+            elif tag == "Title":
+                if parent_tag == "Journal" and node.text is not None:
+                    parts["journal"].append(node.text)
+            elif tag == "AbstractText":
+                if node.text is not None:
+                    parts["abstract"].append(node.text)
+                    label = node.get("Label")
+                    if label == "CONCLUSION":
+                        parts["conclusions"].append(node.text)
+                    elif label == "METHOD":
+                        parts["methods"].append(node.text)
+                    elif label == "RESULTS":
+                        parts["results"].append(node.text)
+            elif tag == "CopyrightInformation":
+                if node.text is not None:
+                    parts["copyrights"].append(node.text)
+            elif tag == "ArticleId":
+                if node.get("IdType") == "doi" and node.text is not None:
+                    parts["doi"].append(node.text)
+
+            # Schedule the children for the same walk
+            if len(node):
+                stack.extend((child, tag) for child in reversed(list(node)))
+
+        # Join the collected text fragments like `get_content` would
+        data: Dict[str, object] = {
+            field: "\n".join(values) for field, values in parts.items()
+        }
+        data["keywords"] = tuple(keywords)
+        data["authors"] = authors
+        data["publication_date"] = publication_date
+        return data
+
+    def initialize_from_xml(
+        self, xml_element: Element, keep_xml: bool = False
+    ) -> None:
         """
         Initializes the article object by parsing an XML element.
 
         Args:
             xml_element (Element): The XML element to parse.
+            keep_xml (bool, optional): Whether to keep a reference to the raw
+                XML element on the article. Defaults to False, so the parsed
+                tree can be reclaimed once extraction is done.
 
         Returns:
             None
         """
-        # Parse the different fields of the article
-        self.pubmed_id = self.extract_pubmed_id(xml_element)
-        self.title = self.extract_title(xml_element)
-        self.keywords = self.extract_keywords(xml_element)
-        self.journal = self.extract_journal(xml_element)
-        self.abstract = self.extract_abstract(xml_element)
-        self.conclusions = self.extract_conclusions(xml_element)
-        self.methods = self.extract_methods(xml_element)
-        self.results = self.extract_results(xml_element)
-        self.copyrights = self.extract_copyrights(xml_element)
-        self.doi = self.extract_doi(xml_element)
-        self.publication_date = self.extract_publication_date(xml_element)
-        self.authors = self.extract_authors(xml_element)
-        self.xml = xml_element
+        # Parse all fields of the article in a single pass over the tree,
+        # then assign every slot in one bulk descriptor pass
+        data = self._parse_stream(xml_element)
+        data["xml"] = xml_element if keep_xml else None
+        self._bulk_set(data[slot] for slot in self._ALL_SLOTS)
 
 
 class Book(PubMedBaseArticle):
@@ -292,6 +655,40 @@ class Book(PubMedBaseArticle):
         "publisher_location",
     )
 
+    # Declarative table of the leaf text fields: (slot name, path). A
+    # compiled expression means "join all matches" via get_content, a plain
+    # path string marks a single-valued field read directly with findtext.
+    # initialize_from_xml assigns these in one generic loop instead of going
+    # through a dedicated extract_* method frame per field.
+    _FIELDS = (
+        ("pubmed_id", ".//ArticleId[@IdType='pubmed']"),
+        ("title", ".//BookTitle"),
+        ("abstract", _XP_ABSTRACT),
+        ("copyrights", ".//CopyrightInformation"),
+        ("doi", _XP_DOI),
+        ("isbn", _XP_ISBN),
+        ("language", _XP_LANGUAGE),
+        ("publication_date", ".//PubDate/Year"),
+        ("publication_type", _XP_PUBLICATION_TYPE),
+        ("publisher", ".//Publisher/PublisherName"),
+        ("publisher_location", ".//Publisher/PublisherLocation"),
+    )
+
+    @classmethod
+    def is_book_element(cls, xml_element: Element) -> bool:
+        """Checks whether an XML element represents a PubMed book article.
+
+        A single tag comparison, so dispatchers can decide whether to build
+        (or skip) a Book before paying for any field extraction.
+
+        Args:
+            xml_element (Element): The XML element to check.
+
+        Returns:
+            bool: True if the element is a PubmedBookArticle, False otherwise.
+        """
+        return xml_element.tag == "PubmedBookArticle"
+
     def extract_pubmed_id(self, xml_element: Element) -> str:
         """
         Extracts the PubMed ID from the XML element.
@@ -302,8 +699,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The PubMed ID.
         """
-        path = ".//ArticleId[@IdType='pubmed']"
-        return get_content(element=xml_element, path=path)
+        return xml_element.findtext(".//ArticleId[@IdType='pubmed']", "")
 
     def extract_title(self, xml_element: Element) -> str:
         """
@@ -315,8 +711,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The title.
         """
-        path = ".//BookTitle"
-        return get_content(element=xml_element, path=path)
+        return xml_element.findtext(".//BookTitle", "")
 
     def extract_abstract(self, xml_element: Element) -> str:
         """
@@ -328,8 +723,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The abstract.
         """
-        path = ".//AbstractText"
-        return get_content(element=xml_element, path=path)
+        return get_content(element=xml_element, path=_XP_ABSTRACT)
 
     def extract_copyrights(self, xml_element: Element) -> str:
         """
@@ -341,8 +735,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The copyrights.
         """
-        path = ".//CopyrightInformation"
-        return get_content(element=xml_element, path=path)
+        return xml_element.findtext(".//CopyrightInformation", "")
 
     def extract_doi(self, xml_element: Element) -> str:
         """
@@ -354,8 +747,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The DOI.
         """
-        path = ".//ArticleId[@IdType='doi']"
-        return get_content(element=xml_element, path=path)
+        return get_content(element=xml_element, path=_XP_DOI)
 
     def extract_isbn(self, xml_element: Element) -> str:
         """
@@ -367,8 +759,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The ISBN.
         """
-        path = ".//Isbn"
-        return get_content(element=xml_element, path=path)
+        return get_content(element=xml_element, path=_XP_ISBN)
 
     def extract_language(self, xml_element: Element) -> str:
         """
@@ -380,8 +771,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The language.
         """
-        path = ".//Language"
-        return get_content(element=xml_element, path=path)
+        return get_content(element=xml_element, path=_XP_LANGUAGE)
 
     def extract_publication_type(self, xml_element: Element) -> str:
         """
@@ -393,8 +783,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The publication type.
         """
-        path = ".//PublicationType"
-        return get_content(element=xml_element, path=path)
+        return get_content(element=xml_element, path=_XP_PUBLICATION_TYPE)
 
     def extract_publication_date(self, xml_element: Element) -> str:
         """
@@ -406,8 +795,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The publication date.
         """
-        path = ".//PubDate/Year"
-        return get_content(element=xml_element, path=path)
+        return xml_element.findtext(".//PubDate/Year", "")
 
     def extract_publisher(self, xml_element: Element) -> str:
         """
@@ -419,8 +807,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The publisher.
         """
-        path = ".//Publisher/PublisherName"
-        return get_content(element=xml_element, path=path)
+        return xml_element.findtext(".//Publisher/PublisherName", "")
 
     def extract_publisher_location(self, xml_element: Element) -> str:
         """
@@ -432,8 +819,7 @@ class Book(PubMedBaseArticle):
         Returns:
             str: The publisher location.
         """
-        path = ".//Publisher/PublisherLocation"
-        return get_content(element=xml_element, path=path)
+        return xml_element.findtext(".//Publisher/PublisherLocation", "")
 
     def extract_authors(self, xml_element: Element) -> List[Dict[str, str]]:
         """
@@ -451,12 +837,12 @@ class Book(PubMedBaseArticle):
         """
         return [
             {
-                "collective": get_content(author, path=".//CollectiveName"),
-                "lastname": get_content(element=author, path=".//LastName"),
-                "firstname": get_content(element=author, path=".//ForeName"),
-                "initials": get_content(element=author, path=".//Initials"),
+                "collective": author.findtext(".//CollectiveName", ""),
+                "lastname": author.findtext(".//LastName", ""),
+                "firstname": author.findtext(".//ForeName", ""),
+                "initials": author.findtext(".//Initials", ""),
             }
-            for author in xml_element.findall(".//Author")
+            for author in _XP_AUTHOR(xml_element)
         ]
 
     def extract_sections(self, xml_element: Element) -> List[Dict[str, str]]:
@@ -473,10 +859,10 @@ class Book(PubMedBaseArticle):
         """
         return [
             {
-                "title": get_content(section, path=".//SectionTitle"),
-                "chapter": get_content(element=section, path=".//LocationLabel"),
+                "title": section.findtext(".//SectionTitle", ""),
+                "chapter": section.findtext(".//LocationLabel", ""),
             }
-            for section in xml_element.findall(".//Section")
+            for section in _XP_SECTION(xml_element)
         ]
 
     def initialize_from_xml(self, xml_element: Element) -> None:
@@ -489,17 +875,13 @@ class Book(PubMedBaseArticle):
             None
         """
 
-        # Parse the different fields of the article
-        self.pubmed_id = self.extract_pubmed_id(xml_element)
-        self.title = self.extract_title(xml_element)
-        self.abstract = self.extract_abstract(xml_element)
-        self.copyrights = self.extract_copyrights(xml_element)
-        self.doi = self.extract_doi(xml_element)
-        self.isbn = self.extract_isbn(xml_element)
-        self.language = self.extract_language(xml_element)
-        self.publication_date = self.extract_publication_date(xml_element)
+        # Parse the leaf text fields from the declarative table
+        for field, path in self._FIELDS:
+            if callable(path):
+                self.__setattr__(field, get_content(element=xml_element, path=path))
+            else:
+                self.__setattr__(field, xml_element.findtext(path, ""))
+
+        # The structured fields need their dedicated extractors
         self.authors = self.extract_authors(xml_element)
-        self.publication_type = self.extract_publication_type(xml_element)
-        self.publisher = self.extract_publisher(xml_element)
-        self.publisher_location = self.extract_publisher_location(xml_element)
         self.sections = self.extract_sections(xml_element)
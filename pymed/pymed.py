@@ -1,23 +1,115 @@
 """ This module contains the PubMed class that is used to interact with the PubMed API. """
 
+import collections
 import datetime
+import io
 import itertools
 import json
-import xml.etree.ElementTree as xml
-from typing import Any, Dict, Union, List, Generator
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Deque, Dict, Iterable, TextIO, Union, List, Generator
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# orjson (Rust) decodes the large esearch payloads severalfold faster than
+# the standard library and consumes the response bytes directly
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .article import Paper, Book
-from .utils import batches, make_date_bins
+from .utils import HAS_LXML, Element, batches, etree, make_date_bins
 
 # Base url for all queries
 BASE_URL = "https://eutils.ncbi.nlm.nih.gov"
 
+# JSON decoder for esearch responses (both accept bytes)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+class _PrefetchReader(io.RawIOBase):
+    """Binary reader that prefetches response chunks on a background thread.
+
+    A small bounded queue lets the download run a couple of chunks ahead of
+    the consumer, so the network wait for the next chunk overlaps with the
+    XML parsing of the current one without buffering the whole body.
+    """
+
+    _CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, response: requests.Response) -> None:
+        super().__init__()
+        self._queue: queue.Queue = queue.Queue(maxsize=2)
+        self._buffer = b""
+        self._eof = False
+        self._thread = threading.Thread(
+            target=self._produce, args=(response,), daemon=True
+        )
+        self._thread.start()
+
+    def _produce(self, response: requests.Response) -> None:
+        # Forward chunks (and a terminating sentinel or error) to the reader
+        try:
+            for chunk in response.iter_content(chunk_size=self._CHUNK_SIZE):
+                self._queue.put(chunk)
+            self._queue.put(b"")
+        except Exception as error:  # delivered to the consuming thread
+            self._queue.put(error)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if not self._buffer and not self._eof:
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                self._eof = True
+                raise item
+            if not item:
+                self._eof = True
+            self._buffer = item
+        count = min(len(buffer), len(self._buffer))
+        buffer[:count] = self._buffer[:count]
+        self._buffer = self._buffer[count:]
+        return count
+
+    def close(self) -> None:
+        if not self.closed:
+            # Unblock the producer if it is still waiting on a full queue;
+            # it exits once the (closed) response stops yielding chunks
+            self._eof = True
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+        super().close()
+
 
 class PubMed(object):
     """Wrapper around the PubMed API."""
 
+    # Fixed attribute layout: no per-instance __dict__, and one less
+    # indirection on every attribute lookup in the request hot path
+    __slots__ = (
+        "tool",
+        "email",
+        "timeout",
+        "rate_limit",
+        "max_retriveable_results",
+        "requests_made",
+        "parameters",
+        "_base_params",
+        "_count_cache",
+        "_lock",
+        "_session",
+    )
+
     def __init__(
         self,
         tool: str = "my_tool",
@@ -46,18 +138,58 @@ class PubMed(object):
         self.email = email
         self.timeout = timeout
 
-        # Keep track of the rate limit
+        # Keep track of the rate limit (monotonic timestamps of the
+        # requests made within the last second)
         self.rate_limit = 10 if api_key is not None else 3
         self.max_retriveable_results = 10000
-        self.requests_made: List[datetime.datetime] = []
+        self.requests_made: Deque[float] = collections.deque(
+            maxlen=self.rate_limit + 1
+        )
+        self._lock = threading.Lock()
 
-        # Define the standard / default query parameters
+        # Cache the per-query result counts so repeated queries do not pay
+        # an extra esearch round-trip just to learn their size
+        self._count_cache: Dict[str, int] = {}
+
+        # Define the standard / default query parameters; the read-only
+        # view is the template each request builds its own dict from
         self.parameters: Dict[str, Any] = {
             "tool": tool,
             "email": email,
             "db": "pubmed",
             "api_key": api_key,
         }
+        self._base_params = MappingProxyType(self.parameters)
+
+        # Use a persistent session so keep-alive reuses the TCP+TLS
+        # connection across the many esearch/efetch requests of a query
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=self.rate_limit * 2,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            ),
+        )
+
+    def close(self) -> None:
+        """Closes the underlying HTTP session and its pooled connections.
+
+        Returns:
+            None
+        """
+        self._session.close()
+
+    def __enter__(self) -> "PubMed":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def query(
         self,
@@ -65,7 +197,8 @@ class PubMed(object):
         max_results: int = -1,
         skip: Union[str, None] = None,
         start_year: int = 1900,
-    ):
+        keep_xml: bool = False,
+    ) -> Generator[Union[Paper, Book], None, None]:
         """
         Method that executes a query against the GraphQL schema, automatically
         inserting the PubMed data loader.
@@ -78,9 +211,12 @@ class PubMed(object):
                 Options - "book", "paper", None (default).
             start_year (int, optional): The year to start the search from.
                 Defaults to 1900.
+            keep_xml (bool, optional): Whether the returned papers keep a
+                reference to their raw XML element. Defaults to False.
 
         Returns:
-            itertools.chain: An iterator that contains the articles matching the query.
+            Generator[Union[Paper, Book], None, None]: A lazy iterator over
+            the articles matching the query.
         """
 
         # Retrieve the article IDs for the query
@@ -88,16 +224,77 @@ class PubMed(object):
             query=query, max_results=max_results, start_year=start_year
         )
 
-        # Get the articles themselves
-        articles = list(
-            [
-                self.get_articles(article_ids=batch, skip=skip)
-                for batch in batches(article_ids, 250)
-            ]
+        # Fetch the batches concurrently but lazily
+        return self._iter_batched_articles(
+            list(batches(article_ids, 250)), skip=skip, keep_xml=keep_xml
         )
 
-        # Chain the batches back together and return the list
-        return itertools.chain.from_iterable(articles)
+    def _iter_batched_articles(
+        self,
+        batch_list: List[list],
+        skip: Union[str, None] = None,
+        keep_xml: bool = False,
+    ) -> Generator[Union[Paper, Book], None, None]:
+        """Helper method that lazily fetches article batches concurrently.
+
+        At most rate_limit batches are in flight or buffered at any moment:
+        results are yielded in batch order as the caller consumes them, and a
+        new batch is only submitted when one is handed out. Peak memory stays
+        at O(prefetch window) instead of O(total results), while the
+        concurrent requests still hide the per-batch round-trip latency.
+
+        Args:
+            batch_list (List[list]): The article ID batches to fetch.
+            skip (str, optional): Option to skip either books or papers.
+                Options - "book", "paper", None (default).
+            keep_xml (bool, optional): Whether the returned papers keep a
+                reference to their raw XML element. Defaults to False.
+
+        Yields:
+            Union[Paper, Book]: Article objects.
+        """
+
+        def fetch(batch: list) -> List[Union[Paper, Book]]:
+            return list(
+                self.get_articles(article_ids=batch, skip=skip, keep_xml=keep_xml)
+            )
+
+        executor = ThreadPoolExecutor(max_workers=self.rate_limit)
+        try:
+            # Fill the prefetch window, then submit one new batch for every
+            # batch that is handed out
+            batch_iter = iter(batch_list)
+            pending = collections.deque(
+                executor.submit(fetch, batch)
+                for batch in itertools.islice(batch_iter, self.rate_limit)
+            )
+            while pending:
+                future = pending.popleft()
+                next_batch = next(batch_iter, None)
+                if next_batch is not None:
+                    pending.append(executor.submit(fetch, next_batch))
+                yield from future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def dump_jsonl(
+        self, results: Iterable[Union[Paper, Book]], fp: TextIO
+    ) -> None:
+        """Writes a stream of articles to a file-like object as JSON Lines.
+
+        Each article is serialized as one compact JSON record per line, so
+        the output can be consumed line by line with bounded memory.
+
+        Args:
+            results (Iterable[Union[Paper, Book]]): The articles to serialize.
+            fp (TextIO): The file-like object to write the records to.
+
+        Returns:
+            None
+        """
+        for article in results:
+            fp.write(article.to_jsonline())
+            fp.write("\n")
 
     def get_total_results_count(self, query: str) -> int:
         """
@@ -109,20 +306,21 @@ class PubMed(object):
         Returns:
             int: The total number of results for the query in PubMed.
         """
-        # Get the default parameters
-        parameters = self.parameters.copy()
+        # Serve repeated queries from the cache (counts drift slowly enough
+        # that staleness within a session is harmless)
+        cached = self._count_cache.get(query)
+        if cached is not None:
+            return cached
 
-        # Add specific query parameters
-        parameters["term"] = query
-        parameters["retmax"] = 1
+        # Build the request parameters from the shared template
+        parameters = dict(self._base_params, term=query, retmax=1, retmode="json")
 
         # Make the request (request a single article ID for this search)
-        response = json.loads(
-            self.get(
-                url="/entrez/eutils/esearch.fcgi", parameters=parameters, retmode="json"
-            )
+        response = _json_loads(
+            self.get(url="/entrez/eutils/esearch.fcgi", parameters=parameters)
         )
         total_results_count = int(response.get("esearchresult", {}).get("count"))
+        self._count_cache[query] = total_results_count
 
         # Return the total number of results (without retrieving them)
         return total_results_count
@@ -133,50 +331,95 @@ class PubMed(object):
         Returns:
             bool: True if the rate limit has been exceeded, False otherwise.
         """
-        # Remove requests from the list that are longer than 1 second ago
-        self.requests_made = [
-            requestTime
-            for requestTime in self.requests_made
-            if requestTime > datetime.datetime.now() - datetime.timedelta(seconds=1)
-        ]
+        # Drop requests that are longer than 1 second ago from the window
+        now = time.monotonic()
+        while self.requests_made and self.requests_made[0] <= now - 1.0:
+            self.requests_made.popleft()
+
+        # Return whether the requests made in the last second fill the rate limit
+        return len(self.requests_made) >= self.rate_limit
+
+    def _claim_request_slot(self) -> None:
+        """Helper method that blocks until a request slot is available.
+
+        Sleeps until the oldest request leaves the one-second window instead
+        of busy-waiting. The lock keeps the window consistent across
+        concurrent batch fetches, and the slot is claimed before the request
+        goes out.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            while self.exceeded_rate_limit():
+                time.sleep(
+                    max(0.0, 1.0 - (time.monotonic() - self.requests_made[0]))
+                )
+            self.requests_made.append(time.monotonic())
+
+    def _get_stream(self, url: str, parameters: dict) -> requests.Response:
+        """Helper method that makes a streaming request to PubMed.
+
+        The response body is not downloaded up front: the caller reads it
+        incrementally (so parsing overlaps with the download) and is
+        responsible for closing the response. As with `get`, the caller
+        supplies the complete parameter dict (including retmode).
+
+        Args:
+            url (str): Last part of the URL that is requested (will be combined with the base url).
+            parameters (dict): Parameters to use for the request.
+
+        Returns:
+            requests.Response: The streaming response object.
+        """
+        # Make sure the rate limit is not exceeded
+        self._claim_request_slot()
+
+        # Make the request to PubMed without reading the body
+        response = self._session.get(
+            f"{BASE_URL}{url}", params=parameters, timeout=self.timeout, stream=True
+        )
+
+        # Check for any errors and make the raw stream decode the transfer encoding
+        response.raise_for_status()
+        response.raw.decode_content = True
 
-        # Return whether we've made more requests in the last second, than the rate limit
-        return len(self.requests_made) > self.rate_limit
+        return response
 
-    def get(self, url: str, parameters: dict, retmode: str = "json") -> str:
+    def get(self, url: str, parameters: dict) -> bytes:
         """Generic helper method that makes a request to PubMed.
 
+        The caller supplies the complete parameter dict (including retmode),
+        so this method never mutates its input and is safe to call from
+        concurrent batch fetches.
+
         Args:
             url (str): Last part of the URL that is requested (will be combined with the base url).
             parameters (dict): Parameters to use for the request.
-            retmode (str, optional): Type of output that is requested (defaults to JSON but can be used to retrieve XML).
 
         Returns:
-            str: If the response is valid JSON it will be parsed before returning, otherwise a string is returned.
+            bytes: The raw response body; JSON callers decode it without an
+            intermediate text conversion.
         """
 
         # Make sure the rate limit is not exceeded
-        while self.exceeded_rate_limit():
-            pass
-
-        # Set the response mode
-        parameters["retmode"] = retmode
+        self._claim_request_slot()
 
         # Make the request to PubMed
-        response = requests.get(
+        response = self._session.get(
             f"{BASE_URL}{url}", params=parameters, timeout=self.timeout
         )
 
         # Check for any errors
         response.raise_for_status()
 
-        # Add this request to the list of requests made
-        self.requests_made.append(datetime.datetime.now())
-
-        return response.text
+        return response.content
 
     def get_articles(
-        self, article_ids: list, skip: Union[str, None] = None
+        self,
+        article_ids: list,
+        skip: Union[str, None] = None,
+        keep_xml: bool = False,
     ) -> Generator[Union[Paper, Book], None, None]:
         """Helper method that batches a list of article IDs and retrieves the content.
 
@@ -184,32 +427,97 @@ class PubMed(object):
             article_ids (list): List of article IDs.
             skip (str, optional): Option to skip either books or papers.
                 Options - "book", "paper", None (default).
-            start_year (int, optional): The year to start the search from.
-                Defaults to 1900.
+            keep_xml (bool, optional): Whether the returned papers keep a
+                reference to their raw XML element. Defaults to False.
 
         Yields:
             Union[Paper, Book]: Article objects.
 
         """
-        # Get the default parameters
-        parameters = self.parameters.copy()
-        parameters["id"] = article_ids
+        # Decide which article tags should be constructed; when everything
+        # is skipped there is nothing to fetch at all
+        wanted = set()
+        if skip != "paper":
+            wanted.add("PubmedArticle")
+        if skip != "book":
+            wanted.add("PubmedBookArticle")
+        if not wanted:
+            return
+
+        # Build the request parameters from the shared template; efetch
+        # takes the IDs as one comma-separated value, which keeps the URL
+        # an order of magnitude shorter than repeating id= per article
+        parameters = dict(
+            self._base_params, id=",".join(map(str, article_ids)), retmode="xml"
+        )
 
-        # Make the request
-        response = self.get(
-            url="/entrez/eutils/efetch.fcgi", parameters=parameters, retmode="xml"
+        # Make the request and parse the body as it downloads, one article
+        # element at a time
+        response = self._get_stream(
+            url="/entrez/eutils/efetch.fcgi", parameters=parameters
         )
+        reader = _PrefetchReader(response)
+        try:
+            yield from self._iterparse_articles(
+                reader, wanted=wanted, keep_xml=keep_xml
+            )
+        finally:
+            response.close()
+            reader.close()
 
-        # Parse as XML
-        root = xml.fromstring(response)
+    def _iterparse_articles(
+        self, stream: io.IOBase, wanted: set, keep_xml: bool = False
+    ) -> Generator[Union[Paper, Book], None, None]:
+        """Helper method that streams article objects out of an efetch document.
 
-        # Loop over the articles and construct article objects
-        if skip != "paper":
-            for article in root.iter("PubmedArticle"):
-                yield Paper(xml_element=article)
-        if skip != "book":
-            for book in root.iter("PubmedBookArticle"):
-                yield Book(xml_element=book)
+        Instead of building the full DOM and walking it afterwards, the
+        document is consumed with iterparse: each article element is
+        converted as soon as it is complete and (unless the raw XML is kept)
+        cleared immediately, so peak memory stays at one article rather than
+        the whole batch.
+
+        Args:
+            stream (io.IOBase): Binary stream with the efetch XML document.
+            wanted (set): The article tag names that should be constructed.
+            keep_xml (bool, optional): Whether the returned papers keep a
+                reference to their raw XML element. Defaults to False.
+
+        Yields:
+            Union[Paper, Book]: Article objects, in document order.
+        """
+        if HAS_LXML:
+            for _, element in etree.iterparse(
+                stream, events=("end",), tag=tuple(wanted)
+            ):
+                yield self._parse_article(element, keep_xml=keep_xml)
+                if not keep_xml:
+                    # Release the subtree and any already-consumed siblings
+                    element.clear(keep_tail=True)
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+        else:
+            # The standard library iterparse has no tag filter
+            for _, element in etree.iterparse(stream, events=("end",)):
+                if element.tag in wanted:
+                    yield self._parse_article(element, keep_xml=keep_xml)
+                    if not keep_xml:
+                        element.clear()
+
+    @staticmethod
+    def _parse_article(element: Element, keep_xml: bool = False) -> Union[Paper, Book]:
+        """Helper method that constructs the right article object for an element.
+
+        Args:
+            element (Element): The article XML element to parse.
+            keep_xml (bool, optional): Whether a returned paper keeps a
+                reference to its raw XML element. Defaults to False.
+
+        Returns:
+            Union[Paper, Book]: The constructed article object.
+        """
+        if Book.is_book_element(element):
+            return Book.from_xml(element)
+        return Paper.from_xml(element, keep_xml=keep_xml)
 
     def get_article_ids(
         self,
@@ -229,34 +537,35 @@ class PubMed(object):
             list: Article IDs as a list.
         """
 
-        # Get the default parameters
-        parameters = self.parameters.copy()
+        # Build the request parameters from the shared template, with the
+        # fetch size cut off by the max_results parameter
+        parameters = dict(
+            self._base_params,
+            term=query,
+            retmax=self.max_retriveable_results
+            if max_results == -1
+            else min(max_results, self.max_retriveable_results),
+            retmode="json",
+        )
 
-        # Add specific query parameters
-        parameters["term"] = query
-        parameters["retmax"] = self.max_retriveable_results
+        # Issue the real esearch straight away: its response carries the
+        # total count alongside the ID list, so no separate counting
+        # request is needed
+        response = _json_loads(
+            self.get(url="/entrez/eutils/esearch.fcgi", parameters=parameters)
+        )
+        esearch_result = response.get("esearchresult", {})
+        total_result_count = int(esearch_result.get("count"))
+        self._count_cache[query] = total_result_count
 
         # If no max is provided (-1) we'll try to retrieve everything
-        total_result_count = self.get_total_results_count(query)
         if max_results == -1:
             max_results = total_result_count
 
-        # Calculate a cut off point based on the max_results parameter
-        if max_results < parameters["retmax"]:
-            parameters["retmax"] = max_results
-
         # Check if the total number of results is larger than the maximum number of results that can be retrieved (10000)
         if total_result_count <= self.max_retriveable_results:
-            response = json.loads(
-                self.get(
-                    url="/entrez/eutils/esearch.fcgi",
-                    parameters=parameters,
-                    retmode="json",
-                )
-            )
-
-            # Add the retrieved IDs to the list
-            article_ids = response.get("esearchresult", {}).get("idlist", [])
+            # The IDs are already in hand
+            article_ids = esearch_result.get("idlist", [])[:max_results]
         else:
             article_ids = self.recurse_bin_processing(
                 start_date=datetime.date(start_year, 1, 1),
@@ -291,37 +600,42 @@ class PubMed(object):
 
         date_bins = make_date_bins(start_date=start_date, end_date=end_date)
 
+        # Snapshot retmax so a cut off applied for one bin (or a recursive
+        # call) does not silently shrink the fetch size of the bins after it
+        base_retmax = parameters["retmax"]
+
         for date_bin in date_bins:
             parameters["mindate"] = date_bin[0]
             parameters["maxdate"] = date_bin[1]
 
             # Calculate a cut off point based on the max_results parameter
-            if max_results < parameters["retmax"]:
-                parameters["retmax"] = max_results
+            parameters["retmax"] = min(base_retmax, max_results)
 
             # Make the request
-            response = json.loads(
-                self.get(
-                    url="/entrez/eutils/esearch.fcgi",
-                    parameters=parameters,
-                    retmode="json",
-                )
+            response = _json_loads(
+                self.get(url="/entrez/eutils/esearch.fcgi", parameters=parameters)
             )
 
             # Add the retrieved IDs to the list
-            article_ids += response.get("esearchresult", {}).get("idlist", [])
+            article_ids.extend(response.get("esearchresult", {}).get("idlist", []))
 
             # Get information from the response
             total_result_count = int(response.get("esearchresult", {}).get("count"))
 
             if total_result_count > self.max_retriveable_results:
-                article_ids += self.recurse_bin_processing(
-                    start_date=datetime.datetime.strptime(
-                        date_bin[0], "%Y/%m/%d"
-                    ).date(),
-                    end_date=datetime.datetime.strptime(date_bin[1], "%Y/%m/%d").date(),
-                    parameters=parameters,
-                    max_results=max_results,
+                # Recurse on a copy so the nested call cannot clobber the
+                # date window and retmax of the remaining bins
+                article_ids.extend(
+                    self.recurse_bin_processing(
+                        start_date=datetime.datetime.strptime(
+                            date_bin[0], "%Y/%m/%d"
+                        ).date(),
+                        end_date=datetime.datetime.strptime(
+                            date_bin[1], "%Y/%m/%d"
+                        ).date(),
+                        parameters=parameters.copy(),
+                        max_results=max_results,
+                    )
                 )
 
         return article_ids
@@ -1,39 +1,79 @@
 """ Helper functions for the pymed package. """
 
-from datetime import date, timedelta
-from typing import Generator, List, Tuple, Union
-from xml.etree.ElementTree import Element
+from datetime import date
+from itertools import chain, islice
+from typing import Callable, Generator, Iterable, List, Tuple, Union
 
+# Use the C-backed lxml parser when it is available, it is an order of
+# magnitude faster than the pure-Python standard library implementation.
+try:
+    from lxml import etree
 
-def batches(iterable: list, n: int = 1) -> Generator[list, None, None]:
+    HAS_LXML = True
+except ImportError:
+    from xml.etree import ElementTree as etree
+
+    HAS_LXML = False
+
+# Element type of the active backend (used in type hints and isinstance checks)
+Element = etree._Element if HAS_LXML else etree.Element
+
+
+def batches(iterable: Iterable, n: int = 1) -> Generator[list, None, None]:
     """Helper method that creates batches from an iterable.
 
     Args:
-        iterable (list): The iterable to batch.
+        iterable (Iterable): The iterable to batch; any iterable works,
+            not just sequences with a known length.
         n (int, optional): The batch size. Defaults to 1.
 
     Yields:
         list: Batches of n objects taken from the iterable.
     """
 
-    # Get the length of the iterable
-    length = len(iterable)
+    # Pull n items at a time until the iterable is exhausted (the last
+    # batch may be shorter)
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, n)):
+        yield batch
+
+
+def compile_path(path: str) -> Callable[[Element], List[Element]]:
+    """Compiles an XPath expression once so it can be evaluated repeatedly.
+
+    Args:
+        path (str): The XPath expression to compile.
+
+    Returns:
+        Callable[[Element], List[Element]]: A callable that evaluates the
+            compiled expression against an element and returns the matches.
+    """
+
+    # lxml compiles the expression to a reusable callable
+    if HAS_LXML:
+        return etree.XPath(path)
+
+    # The standard library has no public precompiled form, fall back to
+    # findall (which caches compiled paths internally)
+    def find_all(element: Element) -> List[Element]:
+        return element.findall(path)
 
-    # Start a loop over the iterable
-    for index in range(0, length, n):
-        # Create a new iterable by slicing the original
-        yield iterable[index : min(index + n, length)]
+    return find_all
 
 
 def get_content(
-    element: Union[Element, None], path: str, default: str = "", separator: str = "\n"
+    element: Union[Element, None],
+    path: Union[str, Callable[[Element], List[Element]]],
+    default: str = "",
+    separator: str = "\n",
 ) -> str:
     """
     Internal helper method that retrieves the text content of an XML element.
 
     Args:
         element (Element or None): The XML element to parse.
-        path (str): Nested path in the XML element.
+        path (str or Callable): Nested path in the XML element, either as a
+            string or as a compiled expression from `compile_path`.
         default (str, optional): Default value to return when no text is found. Defaults to "".
         separator (str, optional): Separator to join multiple text values. Defaults to "\n".
 
@@ -41,17 +81,21 @@ def get_content(
         str: Text in the XML node.
     """
 
-    # Find the path in the element
+    # Find the path in the element (compiled expressions return their
+    # matches directly, string paths stream matches via iterfind without
+    # building an intermediate list)
     if element is None:
-        result = None
-    else:
-        result = element.findall(path)
+        return default
+    matches = path(element) if callable(path) else element.iterfind(path)
 
-    # Return the default if there is no such element
-    if result is None or len(result) == 0:
+    # Join the texts lazily in a single pass; peeking at the first one
+    # avoids the join when there is nothing to return
+    texts = (sub.text for sub in matches if sub.text is not None)
+    first = next(texts, None)
+    if first is None:
         return default
 
-    return separator.join([sub.text for sub in result if sub.text is not None])
+    return separator.join(chain([first], texts))
 
 
 def make_date_bins(
@@ -65,55 +109,41 @@ def make_date_bins(
         end_date (datetime.date): The end date of the range.
 
     Returns:
-        List[Tuple[str, str]]: A list of bins for the given date range in the format (upper bound, lower bound).
+        List[Tuple[str, str]]: A list of bins covering the given date range
+            in the format (lower bound, upper bound).
     """
 
     if start_date > end_date:
         raise ValueError("Start date must be before end date.")
 
-    if (end_date - start_date).days > 366:
-        return [
-            (
-                (end_date - timedelta(days=i)).strftime("%Y/%m/%d"),
-                (end_date - timedelta(days=i - 365)).strftime("%Y/%m/%d"),
-            )
-            for i in range(1, (end_date.year - start_date.year) * 365, 365)
-            if i > 1
-        ]
-
-    if (end_date - start_date).days > 31:
-        return [
+    # Pick a bin width based on the span of the range
+    span = (end_date - start_date).days
+    step = 365 if span > 366 else 28 if span > 31 else 7 if span > 7 else 1
+
+    # Walk the range in ordinal (integer) steps, formatting each boundary
+    # once; the last bin is clamped to the end date
+    bins = []
+    current = start_date.toordinal()
+    end = end_date.toordinal()
+    while current < end:
+        upper = min(current + step, end)
+        lower_date = date.fromordinal(current)
+        upper_date = date.fromordinal(upper)
+        bins.append(
             (
-                (end_date - timedelta(days=i)).strftime("%Y/%m/%d"),
-                (end_date - timedelta(days=i - 28)).strftime("%Y/%m/%d"),
+                f"{lower_date.year:04d}/{lower_date.month:02d}/{lower_date.day:02d}",
+                f"{upper_date.year:04d}/{upper_date.month:02d}/{upper_date.day:02d}",
             )
-            for i in range(1, 365, 28)
-            if i > 1
-        ]
-
-    if (end_date - start_date).days > 7:
-        return [
-            (
-                (end_date - timedelta(days=i)).strftime("%Y/%m/%d"),
-                (end_date - timedelta(days=i - 7)).strftime("%Y/%m/%d"),
-            )
-            for i in range(1, 31, 7)
-            if i > 1
-        ]
+        )
+        current = upper
 
-    if (end_date - start_date).days > 1:
-        return [
+    # A zero-length range still yields a single one-day bin
+    if not bins:
+        bins.append(
             (
-                (end_date - timedelta(days=i)).strftime("%Y/%m/%d"),
-                (end_date - timedelta(days=i - 1)).strftime("%Y/%m/%d"),
+                f"{start_date.year:04d}/{start_date.month:02d}/{start_date.day:02d}",
+                f"{end_date.year:04d}/{end_date.month:02d}/{end_date.day:02d}",
             )
-            for i in range(1, 7)
-            if i > 1
-        ]
-
-    return [
-        (
-            f"{end_date.year}/{end_date.month}/{end_date.day}",
-            f"{end_date.year}/{end_date.month}/{end_date.day - 1}",
         )
-    ]
+
+    return bins
@@ -1,7 +1,9 @@
 """ Unit tests for the PubMed class. """
 
-from datetime import datetime
+import time
 import unittest
+
+from collections import deque
 from unittest.mock import patch, MagicMock
 from pymed import PubMed
 
@@ -36,7 +38,7 @@ class TestPubMed(unittest.TestCase):
             mock_get_article_ids (Mock): Mock object for the get_article_ids method.
         """
         mock_get_article_ids.return_value = [1, 2, 3]
-        self.pubmed.query("test_query", max_results=3)
+        list(self.pubmed.query("test_query", max_results=3))
         mock_get_article_ids.assert_called_once_with(
             query="test_query", max_results=3, start_year=1900
         )
@@ -58,25 +60,26 @@ class TestPubMed(unittest.TestCase):
         """
         Test case for the exceeded_rate_limit method of the Pubmed class.
         """
-        self.pubmed.requests_made = [
-            datetime.now(),
-        ] * 4
+        self.pubmed.requests_made = deque([time.monotonic()] * 4)
         self.pubmed.rate_limit = 3
         self.assertTrue(self.pubmed.exceeded_rate_limit())
 
-    @patch("requests.get")
-    def test_get(self, mock_get):
+        # Requests older than the one-second window no longer count
+        self.pubmed.requests_made = deque([time.monotonic() - 2.0] * 4)
+        self.assertFalse(self.pubmed.exceeded_rate_limit())
+
+    def test_get(self):
         """
         Test case for the get method of the Pubmed class.
-
-        Args:
-            mock_get (Mock): Mock object for the requests.get method.
         """
         mock_response = MagicMock()
-        mock_response.text = "test_response"
-        mock_get.return_value = mock_response
-        result = self.pubmed.get("/test_url", {"param": "value"})
-        self.assertEqual(result, "test_response")
+        mock_response.content = b"test_response"
+        with patch.object(
+            self.pubmed._session, "get", return_value=mock_response
+        ) as mock_get:
+            result = self.pubmed.get("/test_url", {"param": "value"})
+        mock_get.assert_called_once()
+        self.assertEqual(result, b"test_response")
 
 
 if __name__ == "__main__":